@@ -1,44 +1,180 @@
 """
 asr.py- Module for capturing audio from microphone and performing performing speech
 recognition using Faster-Whisper (OpenAI Iteration).
-Supports English and Arabic input, uses CPU (no GPU required), and streams audio via sounddevice.
+Supports English and Arabic input, runs on CPU (no GPU required) or on a CUDA GPU when one is available,
+and streams audio via sounddevice.
 """
+import collections
+import os
 import queue
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+import ctranslate2
 import numpy as np
 import sounddevice as sd
+from numba import njit
 from faster_whisper import WhisperModel
+from faster_whisper.audio import pad_or_trim
+from faster_whisper.feature_extractor import FeatureExtractor
+from faster_whisper.tokenizer import Tokenizer
+from faster_whisper.transcribe import get_compression_ratio, get_suppressed_tokens
+from faster_whisper.vad import get_vad_model
 from PyQt5.QtCore import QThread, pyqtSignal
 
+@njit(cache=True, fastmath=True)
+def _dc_block(samples, y1, x1):
+    """
+    Remove DC offset and low-frequency rumble in place with a one-pole high-pass (DC blocker) filter.
+    :param samples: 1-D float32 audio samples, filtered in place.
+    :param y1: Previous filter output, carried over from the last block.
+    :param x1: Previous filter input, carried over from the last block.
+    :return: The (y1, x1) filter state to pass with the next block.
+    """
+    for i in range(samples.shape[0]):
+        x = samples[i]
+        y = x - x1 + 0.995 * y1
+        x1 = x
+        y1 = y
+        samples[i] = y
+    return y1, x1
+
+class AudioRingBuffer:
+    """
+    Lock-free single-producer/single-consumer ring buffer of preallocated float32 audio blocks.
+    The audio callback is the only writer of the head index and the capture thread the only writer
+    of the tail index, so neither side takes a lock or allocates memory per block.
+    """
+    def __init__(self, block_size: int, capacity: int = 16):
+        """
+        Initialize the ring buffer.
+        :param block_size: Maximum number of samples held by one block.
+        :param capacity: Number of blocks the ring can hold (rounded up to a power of two).
+        """
+        capacity = 1 << max(0, capacity - 1).bit_length()
+        self._mask = capacity - 1
+        self._blocks = np.zeros((capacity, block_size), dtype=np.float32)
+        self._lengths = [0] * capacity
+        self._head = 0
+        self._tail = 0
+        self.dropped = 0
+
+    def write(self, samples: np.ndarray) -> bool:
+        """
+        Copy a block of samples into the next free slot (producer side).
+        :param samples: 1-D array of audio samples.
+        :return: False if the ring was full and the block was dropped, True otherwise.
+        """
+        if self._head - self._tail > self._mask:
+            self.dropped += 1
+            return False
+        slot = self._head & self._mask
+        n = min(samples.shape[0], self._blocks.shape[1])
+        np.copyto(self._blocks[slot, :n], samples[:n])
+        if n < self._blocks.shape[1]:
+            # Clear the rest of a short block so whole-slot reductions do not see stale samples
+            self._blocks[slot, n:] = 0.0
+        self._lengths[slot] = n
+        # Publish the slot only after its samples have been written
+        self._head += 1
+        return True
+
+    def peek_blocks(self):
+        """
+        Return the oldest unread blocks that are contiguous in memory (consumer side), or None if the ring is empty.
+        The views are only valid until release() is called.
+        :return: Tuple (blocks, lengths): a 2-D (count, block_size) view of the slots and the number of samples in each.
+        """
+        available = self._head - self._tail
+        if not available:
+            return None
+        start = self._tail & self._mask
+        # Stop at the end of the array; blocks after the wrap are returned by the next call
+        count = min(available, self._mask + 1 - start)
+        return self._blocks[start:start + count], self._lengths[start:start + count]
+
+    def release(self, count: int = 1):
+        """
+        Mark blocks returned by peek_blocks() as consumed so the producer can reuse their slots.
+        :param count: Number of blocks consumed.
+        """
+        self._tail += count
+
 class AudioCaptureThread(threading.Thread):
     """
     Thread that captures audio from the microphone and segments it into utterances based on silence detection.
-    Segmented audio chunks are put into a queue for transcription.
+    Segmented utterances are converted to log-Mel features and put into a queue for transcription.
     """
-    def __init__(self, segment_queue: queue.Queue, stop_event: threading.Event, samplerate: int = 16000, chunk_duration_sec: float = 0.5, silence_sec: float = 0.8, silence_threshold: float = 0.01):
+    def __init__(self, segment_queue: queue.Queue, stop_event: threading.Event, samplerate: int = 16000, chunk_duration_sec: float = 0.5, silence_sec: float = 0.8, silence_threshold: float = 0.01, max_utterance_sec: float = 30.0, vad_threshold: float = 0.5, vad_neg_threshold: float = 0.4, min_segment_sec: float = 10.0, max_hold_sec: float = 2.0, sub_block_sec: float = 0.02):
         """
         Initialize the audio capture thread.
-        :param segment_queue: Queue to send completed audio segments (numpy arrays of audio samples) for transcription.
+        :param segment_queue: Queue to send completed segments for transcription, as (log-Mel features, Mel bin count,
+                              float32 audio) tuples.
         :param stop_event: Event to signal the thread to stop capturing.
-        :param samplerate: Sampling rate for audio capture (default 16kHz for Whisper model compatibility).
+        :param samplerate: Sampling rate for audio capture; must be 16000, the rate Whisper and the Silero VAD expect.
         :param chunk_duration_sec: Duration of audio (in seconds) per chunk for callback processing.
         :param silence_sec: Amount of continuous silence (in seconds) to consider an utterance boundary.
         :param silence_threshold: RMS amplitude threshold below which audio is considered silence.
+        :param max_utterance_sec: Longest utterance (in seconds) buffered before it is flushed for transcription (at most 30, Whisper's window).
+        :param vad_threshold: Silero VAD speech probability at or above which a frame starts speech.
+        :param vad_neg_threshold: Silero VAD speech probability below which a frame ends speech once it has started.
+        :param min_segment_sec: Minimum amount of audio (in seconds) buffered before an utterance boundary emits a segment;
+                                shorter utterances are coalesced with the following ones.
+        :param max_hold_sec: Silence (in seconds) after which a segment shorter than min_segment_sec is emitted anyway.
+        :param sub_block_sec: Duration (in seconds) of the sub-blocks whose energies give silence timing finer than one block.
         """
         super().__init__(daemon=True)
+        # Silero scores 512-sample windows and Whisper's Mel frames assume 16 kHz; any other rate would feed both
+        # models audio at the wrong time scale, so it is rejected rather than resampled
+        if samplerate != 16000:
+            raise ValueError(f"AudioCaptureThread requires a 16000 Hz sample rate, got {samplerate}.")
         self.samplerate = samplerate
 
         self.segment_queue = segment_queue
         self.stop_event = stop_event
         self.silence_sec = silence_sec
         self.silence_threshold = silence_threshold
+        # Features are computed here so the transcriber only runs the encoder and decoder. The bin count follows the
+        # model that decodes the current mode (see set_feature_size); both shipped models use 80 bins.
+        self.feature_size = 80
+        self._feature_extractors = {}
+        # Squared threshold lets the silence test skip the sqrt
+        self._silence_threshold_sq = silence_threshold ** 2
         
-        #Internal buffer for accumulating audio data for current utterance
-        self._current_buffer=[]
-        self._silence_start_time = None
-        self._audio_frame_queue = queue.Queue(maxsize=10)
+        #Internal preallocated buffer and write cursor for accumulating audio data for current utterance
+        # Segments are decoded as a single Whisper window, so an utterance never exceeds 30 seconds
+        self._utterance = np.empty(int(min(max_utterance_sec, 30.0) * samplerate), dtype=np.float32)
+        self._utterance_len = 0
+        # Length of the current run of silence, counted in samples of the audio clock
+        self._silence_samples = 0
+        # Boundary thresholds in samples, so the per-frame checks are plain integer comparisons
+        self._silence_limit_samples = int(silence_sec * samplerate)
+        self._max_hold_samples = int(max_hold_sec * samplerate)
         self.block_size = int(chunk_duration_sec * samplerate)
+        self._audio_ring = AudioRingBuffer(self.block_size, capacity=16)
+        # Energy (sum of squares) of a sub-block sitting exactly at the RMS threshold
+        self._sub_block_len = max(1, int(sub_block_sec * samplerate))
+        self._sub_block_energy_threshold = self._silence_threshold_sq * self._sub_block_len
+        # Trailing silence of the last speech frame, already written to the utterance buffer
+        self._buffered_silence_samples = 0
+        # DC blocker state carried across blocks so the filter is continuous
+        self._dc_state = (0.0, 0.0)
+        # Silero VAD (bundled with faster-whisper) confirms speech in frames that pass the energy gate.
+        # It scores 512-sample windows at 16kHz, so frames are zero-padded into a scratch buffer.
+        self.vad_threshold = vad_threshold
+        self.vad_neg_threshold = vad_neg_threshold
+        # Whether the previous frame was speech, for the VAD hysteresis
+        self._in_speech = False
+        self._vad_model = get_vad_model()
+        self._vad_input = np.zeros((1, -(-self.block_size // 512) * 512), dtype=np.float32)
+        self._min_segment_samples = int(min_segment_sec * samplerate)
+        self.max_hold_sec = max_hold_sec
+        # Stream status events are recorded by the callback and reported from run()
+        self._status_events = 0
+        self._reported_status_events = 0
+        self._last_status = None
+        # Blocks the ring dropped because run() fell behind, as of the last report
+        self._reported_dropped = 0
         self._stream_started = False
         self._stream = None
 
@@ -48,56 +184,46 @@ class AudioCaptureThread(threading.Thread):
         It is called in a seperate thread by sounddevice for each audio block.
         """
         if status:
-            print(f"Audio input status: {status}", flush=True)
-        # Copy the data to avoid referencing the input buffer
-        try:
-            self._audio_frame_queue.put_nowait(indata.copy())
-        except queue.Full:
-            try:
-                self._audio_frame_queue.get_nowait()
-            except queue.Empty:
-                pass
-            try:
-                self._audio_frame_queue.put_nowait(indata.copy())
-            except queue.Full:
-                pass
-            
+            # Printing would take the stdout lock on the realtime thread; count the event for run() to report
+            self._last_status = status
+            self._status_events += 1
+        # Copy the mono channel into a preallocated ring slot to avoid referencing the input buffer.
+        # If the consumer has fallen behind, the newest block is dropped.
+        self._audio_ring.write(indata[:, 0])
+
     def run(self):
         """Run the audio capture thread, reading microphone input and segmenting audio based on silence."""
         try:
-            # Open the microphone input stream
-            self._stream = sd.InputStream(channels=1, samplerate=self.samplerate, blocksize=self.block_size, callback=self.audio_callback)
+            # Open the microphone input stream. Blocks are large (chunk_duration_sec), so the callback only
+            # runs a few times per second; "high" latency lets the host API use matching, larger device buffers.
+            self._stream = sd.InputStream(channels=1, samplerate=self.samplerate, blocksize=self.block_size, dtype="float32", latency="high", callback=self.audio_callback)
             self._stream.start()
             self._stream_started = True
         except Exception as e:
             print(f"Failed to start audio stream: {e}")
             return
+        # Compile the kernels now so the JIT cost does not land on the first real frame
+        _dc_block(np.zeros(1, dtype=np.float32), 0.0, 0.0)
         # Process audio frames until stopped
         while not self.stop_event.is_set():
-            try:
-                frame = self._audio_frame_queue.get(timeout=0.1)
-            except queue.Empty:
+            if self._status_events != self._reported_status_events:
+                self._report_status()
+            if self._audio_ring.dropped != self._reported_dropped:
+                self._report_dropped()
+            pending = self._audio_ring.peek_blocks()
+            if pending is None:
+                self.stop_event.wait(0.01)
                 continue
-            audio_frame = np.array(frame).astype(np.float32).flatten()
-            rms = np.sqrt(np.mean(audio_frame**2)) if audio_frame.size > 0 else 0.0
-            current_time = time.time()
-            if rms < self.silence_threshold:
-                if self._silence_start_time is None:
-                    self._silence_start_time = current_time
-                if self._silence_start_time is not None and (current_time - self._silence_start_time) >= self.silence_sec and self._current_buffer:
-                    segment = np.concatenate(self._current_buffer)
-                    self._current_buffer = []
-                    self._silence_start_time = None
-                    # Put the completed audio segment into the segment queue for transcription
-                    try:
-                        self.segment_queue.put_nowait(segment)
-                    except queue.Full:
-                        print("Warning: transcription queue is full. Dropping segment.")
-            else:
-                # Audio frame has speech (above silence threshold)
-                # Append to current buffer
-                self._current_buffer.append(audio_frame)
-                self._silence_start_time = None
+            # Every block that has piled up is handled in one pass, so a backlog costs one energy reduction.
+            # Blocks are float32 views into the ring, so no conversion is needed.
+            frames, lengths = pending
+            # Filter out DC offset and rumble in place so the energy reflects the speech band only
+            for i, n in enumerate(lengths):
+                self._dc_state = _dc_block(frames[i, :n], *self._dc_state)
+            voiced = self._voiced_sub_blocks(frames)
+            for i, n in enumerate(lengths):
+                self._process_frame(frames[i, :n], voiced[i], n // self._sub_block_len)
+            self._audio_ring.release(len(lengths))
         if self._stream and self._stream_started:
             try:
                 self._stream.stop()
@@ -105,22 +231,128 @@ class AudioCaptureThread(threading.Thread):
             except Exception as e:
                 print(f"Error closing audio stream: {e}")
 
+    def _report_status(self):
+        """Print the stream status events recorded by the audio callback since the last report."""
+        events = self._status_events
+        print(f"Audio input status: {self._last_status} ({events - self._reported_status_events} event(s))", flush=True)
+        self._reported_status_events = events
+
+    def _report_dropped(self):
+        """Print how many audio blocks the ring dropped since the last report because processing fell behind."""
+        dropped = self._audio_ring.dropped
+        print(f"Warning: audio processing fell behind; dropped {dropped - self._reported_dropped} block(s) of audio.", flush=True)
+        self._reported_dropped = dropped
+
+    def _process_frame(self, audio_frame, voiced_bits: int, n_sub: int):
+        """
+        Classify one frame as speech or silence and update the utterance buffer, emitting a segment at a boundary.
+        :param audio_frame: 1-D float32 audio samples (a view into the ring).
+        :param voiced_bits: Bitmask of the frame's sub-blocks that are above the silence threshold.
+        :param n_sub: Number of whole sub-blocks in the frame.
+        """
+        # Cheap energy gate first; only frames with a voiced sub-block are scored by the VAD.
+        # Speech starts at vad_threshold but only ends below the lower vad_neg_threshold.
+        vad_threshold = self.vad_neg_threshold if self._in_speech else self.vad_threshold
+        is_speech = voiced_bits != 0 and self._speech_probability(audio_frame) >= vad_threshold
+        self._in_speech = is_speech
+        if not is_speech:
+            self._silence_samples += audio_frame.size
+            # Emit at an utterance boundary once enough speech is buffered, or after a long pause
+            if self._utterance_len and self._silence_samples >= self._silence_limit_samples and (self._utterance_len >= self._min_segment_samples or self._silence_samples >= self._max_hold_samples):
+                self._emit_segment()
+                self._silence_samples = 0
+        else:
+            # Audio frame has speech (above silence threshold and confirmed by the VAD)
+            n = audio_frame.size
+            # Keep the pause since the previous speech as zeros so Whisper sees the utterance spacing
+            gap = self._silence_samples - self._buffered_silence_samples if self._utterance_len else 0
+            if self._utterance_len + gap + n > self._utterance.size:
+                # Utterance buffer is full; flush it so this frame starts a new segment
+                self._emit_segment()
+                gap = 0
+            if gap:
+                self._utterance[self._utterance_len:self._utterance_len + gap] = 0.0
+                self._utterance_len += gap
+            # Copy into the utterance buffer, since the ring slot will be reused
+            self._utterance[self._utterance_len:self._utterance_len + n] = audio_frame
+            self._utterance_len += n
+            # The silent sub-blocks at the end of this frame already count toward the next boundary. The mask can
+            # also hold a bit for a zero-padded partial sub-block past n_sub, so the count is clamped at zero.
+            self._silence_samples = max(0, n_sub - voiced_bits.bit_length()) * self._sub_block_len
+            self._buffered_silence_samples = self._silence_samples
+
+    def _voiced_sub_blocks(self, frames) -> list:
+        """
+        Compare the energies of all sub-blocks of a stack of frames with the silence threshold in one vectorized pass.
+        :param frames: 2-D (count, block_size) float32 audio frames; samples past a frame's length must be zero.
+        :return: One bitmask per frame, where bit i is set when sub-block i is above the threshold.
+        """
+        n_sub = frames.shape[1] // self._sub_block_len
+        sub_blocks = frames[:, :n_sub * self._sub_block_len].reshape(frames.shape[0], n_sub, self._sub_block_len)
+        energies = np.einsum("ijk,ijk->ij", sub_blocks, sub_blocks)
+        voiced = np.packbits(energies >= self._sub_block_energy_threshold, axis=1, bitorder="little")
+        return [int.from_bytes(row.tobytes(), "little") for row in voiced]
+
+    def _speech_probability(self, audio_frame) -> float:
+        """
+        Score a frame with the Silero VAD model.
+        :param audio_frame: 1-D float32 audio samples (at most one block).
+        :return: The highest speech probability over the frame's 512-sample windows.
+        """
+        n = audio_frame.size
+        self._vad_input[0, :n] = audio_frame
+        self._vad_input[0, n:] = 0.0
+        return float(self._vad_model(self._vad_input).max())
+
+    def set_feature_size(self, feature_size: int):
+        """
+        Set the number of Mel bins of the model decoding the current mode; later segments are extracted with it.
+        :param feature_size: Mel bin count of the model's feature extractor (80 or 128).
+        """
+        self.feature_size = feature_size
+
+    def _emit_segment(self):
+        """Compute log-Mel features of the buffered utterance, reset the buffer and queue the segment for transcription."""
+        feature_size = self.feature_size
+        extractor = self._feature_extractors.get(feature_size)
+        if extractor is None:
+            extractor = self._feature_extractors[feature_size] = FeatureExtractor(feature_size=feature_size)
+        segment = self._utterance[:self._utterance_len].copy()
+        self._utterance_len = 0
+        # Features are padded to the 3000 frames (30 s) the encoder expects. The audio travels with them so the
+        # transcriber can extract again if the mode switched to a model with a different bin count meanwhile.
+        features = pad_or_trim(extractor(segment)[:, :-1])
+        # Put the completed segment into the segment queue for transcription
+        try:
+            self.segment_queue.put_nowait((features, feature_size, segment))
+        except queue.Full:
+            print("Warning: transcription queue is full. Dropping segment.")
+
 class ASRTranscriber(QThread):
     """
-    Thread that consumes audio segments and performs speech-to-text using Faster-Whisper,
+    Thread that consumes log-Mel segments and performs speech-to-text using Faster-Whisper,
     then translates the text to the target language using the provided Translator.
     Emits the translated text to a Qt signal for display.
     """
     new_text = pyqtSignal(str)
 
-    def __init__(self, segment_queue: queue.Queue, translator, logger, initial_mode: str = "EN->AR", model_size: str = "small"):
+    def __init__(self, segment_queue: queue.Queue, translator, logger, initial_mode: str = "EN->AR", model_size: str = "small", english_model_size: str = "distil-small.en", max_batch: int = 4, cpu_threads: int = 0, device: str = "auto", compute_type: str = "auto", download_root: str = None, set_feature_size=None):
         """
         Initialize the ASR transcriber thread.
-        :param segment_queue: Queue from which to read audio segments for transcription.
+        :param segment_queue: Queue from which to read segment features for transcription.
         :param translator: Translator instance for performing translations.
         :param logger: Logger instance for logging English text.
         :param initial_mode: Initial translation mode ("EN->AR" or "AR->EN").
-        :param model_size: Size of the Whisper model to load (default "small").
+        :param model_size: Size of the multilingual Whisper model used for Arabic speech (default "small").
+        :param english_model_size: Whisper model used for English speech (default "distil-small.en").
+        :param max_batch: Maximum number of queued segments transcribed together in one batched model call.
+        :param cpu_threads: CTranslate2 threads for the model (0 uses the cores this process may run on that the
+                            translator does not use).
+        :param device: Device to run Whisper on ("cpu", "cuda", or "auto" to use a CUDA GPU when available).
+        :param compute_type: CTranslate2 compute type ("auto" picks float16 on GPU and int8 on CPU).
+        :param download_root: Persistent directory where Whisper models are downloaded and reused across runs
+                              (default: the Hugging Face cache).
+        :param set_feature_size: Callback told the Mel bin count of the model in use, so segments are extracted to match.
         """
         super().__init__()
         self.segment_queue = segment_queue
@@ -128,62 +360,293 @@ class ASRTranscriber(QThread):
         self.logger = logger
         self.mode = initial_mode
         self.model_size = model_size
-        self._model = None
+        self.english_model_size = english_model_size
+        self.max_batch = max_batch
+        # How long to wait for more segments to join a batch once the first one has arrived
+        self._batch_wait_sec = 0.1
+        # Whisper and the translator decode concurrently, so both are sized from one budget: the cores this process
+        # may run on (affinity, cgroup cpusets), of which the translator reports the share it uses
+        available_cores = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else (os.cpu_count() or 2)
+        self.cpu_threads = cpu_threads or max(1, available_cores - translator.cpu_threads)
+        if device == "auto":
+            device = "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+        if compute_type == "auto":
+            compute_type = "float16" if device == "cuda" else "int8"
+        self.device = device
+        self.compute_type = compute_type
+        self.download_root = download_root
+        # Translations run on their own worker so they overlap with transcription of the next segments
+        self._max_translations_in_flight = 2
+        # Whisper models keyed by model size; each model is loaded on a background thread the first time its
+        # language is needed, so a mode switch never stalls decoding while a model downloads and warms up
+        self._models = {}
+        self._model_loader = None
+        # Loads in progress keyed by model size, and sizes that failed to load (they are not retried)
+        self._model_loads = {}
+        self._failed_models = set()
+        # Model that decoded the last batch; a multilingual one keeps decoding while the new mode's model loads
+        self._active_model = None
+        # Segments that arrive while no loaded model can decode them wait here, dropping the oldest beyond this
+        self._max_held_segments = 10
+        # Tokenizer, decoder prompt and suppressed tokens keyed by (model, language); they are constant for a session
+        self._decode_setup = {}
+        self.set_feature_size = set_feature_size
+        # Mel bin count last passed to set_feature_size (the capture thread starts at 80)
+        self._feature_size = 80
+        # Whisper's decoding safeguards, with transcribe()'s defaults: drop segments the model scores as non-speech
+        # unless the transcript is confident, and decode highly compressible (looping) or improbable transcripts
+        # again with sampling at rising temperatures, keeping the most likely attempt if none passes
+        self._no_speech_threshold = 0.6
+        self._log_prob_threshold = -1.0
+        self._compression_ratio_threshold = 2.4
+        self._fallback_temperatures = (0.2, 0.4, 0.6, 0.8, 1.0)
+        # Last text sent to the GUI, so a phrase Whisper repeats does not trigger another identical repaint
+        self._last_emitted_text = None
         # Load the Whisper model in the run() to avoid blocking the main thread on initialization.
 
     def run(self):
         """Run the transcription and translation thread. Loads the ASR model and processes audio segments."""
-        try:
-            self._model = WhisperModel(self.model_size, device="cpu", compute_type="int8")
-        except Exception as e:
-            print(f"Failed to load Whisper model (size={self.model_size}): {e}")
-            return
-        while not self.isInterruptionRequested():
+        self._model_loader = ThreadPoolExecutor(max_workers=1)
+        # Start loading the initial model; segments are held until it is ready
+        self._get_model(self.mode)
+        # A single translation worker keeps results emitted in segment order
+        translation_pool = ThreadPoolExecutor(max_workers=1)
+        translations_in_flight = collections.deque()
+        held = collections.deque(maxlen=self._max_held_segments)
+        stop = False
+        while not stop and not self.isInterruptionRequested():
+            batch = []
             try:
                 segment = self.segment_queue.get(timeout=0.1)
             except queue.Empty:
+                # Nothing new, but held segments can go as soon as their model is ready
+                if not held:
+                    continue
+            else:
+                if segment is None:
+                    break
+                # Collect segments that arrive within a short deadline so they are transcribed together
+                batch.append(segment)
+                deadline = time.monotonic() + self._batch_wait_sec
+                while len(batch) < self.max_batch:
+                    try:
+                        segment = self.segment_queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                    except queue.Empty:
+                        break
+                    if segment is None:
+                        stop = True
+                        break
+                    batch.append(segment)
+            mode = self.mode
+            language = "en" if mode == "EN->AR" else "ar"
+            model = self._get_model(mode)
+            if model is None:
+                # Keep draining the queue so capture does not drop segments while the model loads;
+                # if the load failed there is nothing to decode them with
+                if self._model_loads:
+                    held.extend(batch)
+                else:
+                    held.clear()
                 continue
-            if segment is None:
-                break
-            # Perform speech recognition on the audio segment.
-            try:
-                language = "en" if self.mode == "EN->AR" else "ar"
-                segments, info = self._model.transcribe(segment, language=language)
-                # Collect the transcribed text from the segments generator
-                transcribed_text = "".join([seg.text for seg in segments]).strip()
-            except Exception as e:
-                print(f"Transcription failed: {e}")
-                transcribed_text = ""
-            if not transcribed_text:
-                continue
-            if self.mode == "EN->AR":
-                translated_text = self.translator.translate_en_to_ar(transcribed_text)
-                english_text_to_log = transcribed_text  # source was English
+            feature_size = model.feature_extractor.mel_filters.shape[0]
+            if feature_size != self._feature_size and self.set_feature_size is not None:
+                self.set_feature_size(feature_size)
+                self._feature_size = feature_size
+            if held:
+                batch = list(held) + batch
+                held.clear()
+            # Perform speech recognition a batch at a time; results come back in segment order
+            for start in range(0, len(batch), self.max_batch):
+                for transcribed_text in self._transcribe_batch(model, batch[start:start + self.max_batch], language):
+                    if not transcribed_text:
+                        continue
+                    # Collect finished translations and block on the oldest one when too many are pending
+                    while translations_in_flight and (translations_in_flight[0].done() or len(translations_in_flight) >= self._max_translations_in_flight):
+                        translations_in_flight.popleft().result()
+                    translations_in_flight.append(translation_pool.submit(self._translate_and_emit, transcribed_text, mode))
+        translation_pool.shutdown(wait=True)
+        # A load still in progress finishes on its own; its model is discarded
+        self._model_loader.shutdown(wait=False)
+        self._model_loads.clear()
+        self._models.clear()
+        self._decode_setup.clear()
+
+    def _get_model(self, mode: str):
+        """
+        Return the Whisper model for the mode's source language, starting a background load on first use.
+        English speech uses the smaller English-only model; Arabic speech uses the multilingual model.
+        Until that model is ready, a multilingual model already in use decodes the mode's language instead.
+        :param mode: Translation mode ("EN->AR" or "AR->EN").
+        :return: The WhisperModel to decode with, or None if no loaded model can decode the mode's language.
+        """
+        model_size = self.english_model_size if mode == "EN->AR" else self.model_size
+        model = self._models.get(model_size)
+        if model is None:
+            load = self._model_loads.get(model_size)
+            if load is None and model_size not in self._failed_models:
+                self._model_loads[model_size] = self._model_loader.submit(self._load_model, model_size, mode)
+            elif load is not None and load.done():
+                del self._model_loads[model_size]
+                model = load.result()
+                if model is None:
+                    self._failed_models.add(model_size)
+                else:
+                    self._models[model_size] = model
+            if model is None:
+                active = self._active_model
+                return active if active is not None and active.model.is_multilingual else None
+        self._active_model = model
+        return model
+
+    def _load_model(self, model_size: str, mode: str):
+        """
+        Load a Whisper model and warm it up, along with the mode's translation direction. Runs on the loader thread.
+        :param model_size: Whisper model size or CTranslate2 model directory.
+        :param mode: Translation mode the model is loaded for.
+        :return: The WhisperModel, or None if the model failed to load.
+        """
+        try:
+            model = WhisperModel(model_size, device=self.device, compute_type=self.compute_type, cpu_threads=self.cpu_threads, download_root=self.download_root)
+        except Exception as e:
+            print(f"Failed to load Whisper model (size={model_size}): {e}")
+            return None
+        # Transcribe one second of silence so weights are paged in and kernels are selected before real speech
+        language = "en" if mode == "EN->AR" else "ar"
+        silence = np.zeros(16000, dtype=np.float32)
+        features = pad_or_trim(model.feature_extractor(silence)[:, :-1])
+        self._transcribe_batch(model, [(features, features.shape[0], silence)], language)
+        # The first segment of the mode should not wait for its translation model either
+        try:
+            self.translator.preload(mode.lower())
+        except Exception as e:
+            print(f"Failed to load translation model ({mode}): {e}")
+        return model
+
+    def _transcribe_batch(self, model, batch, language: str) -> list:
+        """
+        Perform speech recognition on several segments with one batched encoder and decoder call.
+        :param model: Whisper model to run.
+        :param batch: Queued (log-Mel features, Mel bin count, 16 kHz float32 audio) tuples, each at most 30 s long.
+        :param language: Whisper language code of the speech ("en" or "ar").
+        :return: The transcribed texts in segment order (empty strings for non-speech or failed segments).
+        """
+        try:
+            tokenizer, prompt, suppress_tokens = self._get_decode_setup(model, language)
+            # Features already match the model unless the mode switched to one with a different Mel bin count
+            # after they were queued; only those segments are extracted again, with the model's own extractor.
+            feature_size = model.feature_extractor.mel_filters.shape[0]
+            features = np.stack([
+                segment_features if segment_size == feature_size else pad_or_trim(model.feature_extractor(audio)[:, :-1])
+                for segment_features, segment_size, audio in batch
+            ])
+            # The batch is encoded once. Retries decode the whole batch again from the same encoder output and only
+            # read the retried segments' results; batched decoding runs as long as its longest sequence, which is
+            # the looping segment being retried, so the segments that already passed add little.
+            encoder_output = model.encode(features)
+            prompts = [prompt] * len(batch)
+            texts = [""] * len(batch)
+            # Failed attempts of each segment as (below compression threshold, average log probability, text)
+            attempts = [[] for _ in batch]
+            pending = list(range(len(batch)))
+            for temperature in (0.0,) + self._fallback_temperatures:
+                results = model.model.generate(
+                    encoder_output,
+                    prompts,
+                    beam_size=1,
+                    max_length=model.max_length,
+                    # Greedy first; retries sample from the full distribution at the given temperature
+                    sampling_topk=1 if temperature == 0.0 else 0,
+                    sampling_temperature=temperature if temperature > 0.0 else 1.0,
+                    suppress_blank=True,
+                    suppress_tokens=suppress_tokens,
+                    return_scores=True,
+                    return_no_speech_prob=True,
+                )
+                retry = []
+                for i in pending:
+                    result = results[i]
+                    tokens = result.sequences_ids[0]
+                    # Same average as transcribe(): the length-normalised score over the tokens plus end-of-text
+                    avg_logprob = result.scores[0] * len(tokens) / (len(tokens) + 1)
+                    # Music, noise or near-silence that got past the VAD; decoding again would only invent other text
+                    if result.no_speech_prob > self._no_speech_threshold and avg_logprob < self._log_prob_threshold:
+                        continue
+                    text = tokenizer.decode(tokens).strip()
+                    compression_ratio = get_compression_ratio(text)
+                    if compression_ratio > self._compression_ratio_threshold or avg_logprob < self._log_prob_threshold:
+                        attempts[i].append((compression_ratio <= self._compression_ratio_threshold, avg_logprob, text))
+                        retry.append(i)
+                    else:
+                        texts[i] = text
+                if not retry:
+                    break
+                pending = retry
             else:
-                translated_text = self.translator.translate_ar_to_en(transcribed_text)
-                english_text_to_log = translated_text  # result is English
-            # Emit the translated text for GUI display
-            self.new_text.emit(translated_text if translated_text is not None else "")
-            if english_text_to_log:
-                self.logger.log(english_text_to_log)
-        self._model = None
+                # No temperature passed: keep the most likely attempt, preferring ones that are not looping
+                for i in pending:
+                    texts[i] = max(attempts[i])[2]
+            return texts
+        except Exception as e:
+            print(f"Transcription failed: {e}")
+            return [""] * len(batch)
+
+    def _get_decode_setup(self, model, language: str):
+        """
+        Return the tokenizer, decoder prompt and suppressed tokens for a model and language, building them on first use.
+        :param model: Whisper model the segments are decoded with.
+        :param language: Whisper language code of the speech ("en" or "ar").
+        :return: Tuple of (tokenizer, prompt token ids, suppressed token ids).
+        """
+        key = (id(model), language)
+        setup = self._decode_setup.get(key)
+        if setup is None:
+            tokenizer = Tokenizer(model.hf_tokenizer, model.model.is_multilingual, task="transcribe", language=language)
+            # No previous-text conditioning and no timestamp tokens: short segments decode in fewer steps
+            prompt = model.get_prompt(tokenizer, [], without_timestamps=True)
+            setup = (tokenizer, prompt, list(get_suppressed_tokens(tokenizer, [-1])))
+            self._decode_setup[key] = setup
+        return setup
+
+    def _translate_and_emit(self, transcribed_text: str, mode: str):
+        """
+        Translate transcribed text, emit it for display and log the English side.
+        :param transcribed_text: Text recognized from the audio segment.
+        :param mode: Translation mode the segment was transcribed in.
+        """
+        if mode == "EN->AR":
+            translated_text = self.translator.translate_en_to_ar(transcribed_text)
+            english_text_to_log = transcribed_text  # source was English
+        else:
+            translated_text = self.translator.translate_ar_to_en(transcribed_text)
+            english_text_to_log = translated_text  # result is English
+        # Emit the translated text for GUI display unless it is already on screen
+        translated_text = translated_text if translated_text is not None else ""
+        if translated_text != self._last_emitted_text:
+            self._last_emitted_text = translated_text
+            self.new_text.emit(translated_text)
+        if english_text_to_log:
+            self.logger.log(english_text_to_log)
 
 class ASR:
     """
     ASR manager class that ties together the audio capture and transcription threads.
     Provides methods to start/stop the threads and to change translation mode.
     """
-    def __init__(self, translator, logger, model_size: str = "small"):
+    def __init__(self, translator, logger, model_size: str = "small", device: str = "auto", compute_type: str = "auto", download_root: str = None):
         """
         Initialize the ASR system with given translator and logger.
         :param translator: Translator instance for performing translations.
         :param logger: Logger instance for logging English text.
-        :param model_size: Whisper model size to use for ASR (default "small").
+        :param model_size: Whisper model size to use for ASR (default "small"), or the path of a pre-converted
+                           CTranslate2 model directory to avoid the first-run download.
+        :param device: Device to run Whisper on ("cpu", "cuda", or "auto" to use a CUDA GPU when available).
+        :param compute_type: CTranslate2 compute type for Whisper ("auto" picks float16 on GPU and int8 on CPU).
+        :param download_root: Persistent directory for downloaded Whisper models (default: the Hugging Face cache).
         """
         self.segment_queue = queue.Queue(maxsize=5)
         self.stop_event = threading.Event()
         self.capture_thread = AudioCaptureThread(self.segment_queue, self.stop_event)
-        self.transcriber_thread = ASRTranscriber(self.segment_queue, translator, logger, initial_mode="EN->AR", model_size=model_size)
+        self.transcriber_thread = ASRTranscriber(self.segment_queue, translator, logger, initial_mode="EN->AR", model_size=model_size, device=device, compute_type=compute_type, download_root=download_root, set_feature_size=self.capture_thread.set_feature_size)
 
     def start(self):
         """Start the audio capture and transcription threads."""
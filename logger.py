@@ -3,16 +3,23 @@ logger.py - Module for logging transcripts and translations to disk.
 """
 import os
 import datetime
+import queue
+import threading
+import time
 
 class Logger:
     """
     Logger class to record English transcripts or translations with timestamps.
     Logs are saved to timestamped text files for later use (e.g., summarization).
+    Lines are written by a background thread in batches, so logging never blocks the caller on disk I/O.
     """
-    def __init__(self, log_dir: str = "logs"):
+    def __init__(self, log_dir: str = "logs", flush_interval_sec: float = 0.5, flush_lines: int = 64):
         """
         Initialize the logger by creating a new log file.
         The log file is placed in `log_dir` and named with the current date and time.
+        :param log_dir: Directory in which the log file is created.
+        :param flush_interval_sec: Longest time (in seconds) a logged line waits before it is written and flushed.
+        :param flush_lines: Number of pending lines that triggers an immediate write and flush.
         """
         self.log_dir = log_dir
         os.makedirs(self.log_dir, exist_ok=True)
@@ -27,23 +34,57 @@ class Logger:
         start_time = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         self.file.write(f"Log started at {start_time}\n")
         self.file.flush()
+        self.flush_interval_sec = flush_interval_sec
+        self.flush_lines = flush_lines
+        self._ts_fmt = "[%H:%M:%S] "
+        # Pending (time, text) entries; None is the sentinel that stops the writer thread
+        self._queue = queue.Queue()
+        self._writer = threading.Thread(target=self._write_loop, daemon=True)
+        self._writer.start()
 
     def log(self, text: str):
         """
         Log a line of text with a timestamp (in HH:MM:SS format).
-        Only log if text is non-empty.
+        Only log if text is non-empty. The line is queued and written by the background writer thread.
         """
         if not text:
             return
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-        try:
-            self.file.write(f"[{timestamp}] {text}\n")
-            self.file.flush()
-        except Exception as e:
-            print(f"Logging error: {e}")
+        self._queue.put_nowait((datetime.datetime.now(), text))
+
+    def _write_loop(self):
+        """Write queued lines in batches, flushing once per batch, until the sentinel is received."""
+        closing = False
+        while not closing:
+            entry = self._queue.get()
+            if entry is None:
+                break
+            lines = [self._format(entry)]
+            # Gather more lines until the batch is full or the flush interval has elapsed
+            deadline = time.monotonic() + self.flush_interval_sec
+            while len(lines) < self.flush_lines:
+                try:
+                    entry = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if entry is None:
+                    closing = True
+                    break
+                lines.append(self._format(entry))
+            try:
+                self.file.writelines(lines)
+                self.file.flush()
+            except Exception as e:
+                print(f"Logging error: {e}")
+
+    def _format(self, entry) -> str:
+        """Format a queued (time, text) entry as a log line."""
+        logged_at, text = entry
+        return f"{logged_at.strftime(self._ts_fmt)}{text}\n"
 
     def close(self):
-        """Close the log file."""
+        """Write any pending lines and close the log file."""
+        self._queue.put(None)
+        self._writer.join(timeout=5.0)
         try:
             self.file.close()
         except Exception as e:
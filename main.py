@@ -5,13 +5,13 @@ Initializes all modules, starts the threads, and launches the GUI.
 import sys
 from PyQt5.QtWidgets import QApplication
 from asr import ASR
-from translation import Translator
+from translation import get_translator
 from logger import Logger
 from gui import TranslatorGUI
 
 def main():
     """Main function to start the real-time sermon translator."""
-    translator = Translator()
+    translator = get_translator()
     logger = Logger()
     asr_system = ASR(translator, logger)
     app = QApplication(sys.argv)
@@ -25,6 +25,7 @@ def main():
     finally:
         asr_system.stop()
         logger.close()
+        translator.close()
 
 if __name__ == "__main__":
     main()
@@ -1,28 +1,186 @@
 """
 translation.py - Module for translating text between English and Arabic using Argos Translate.
 """
+import collections
+import functools
+import json
+import os
+import queue
+import re
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+import ctranslate2
+import numpy as np
+from numba import njit
 import argostranslate.package
+import argostranslate.settings
 import argostranslate.translate
 
+# Scanning the package directory parses every package's metadata; the result only changes when a package is installed
+_get_langs = functools.lru_cache(maxsize=1)(argostranslate.translate.get_installed_languages)
+
+# Whitespace after sentence-final punctuation (Latin and Arabic question mark); the punctuation stays with its sentence
+_SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?\u061F])\s+")
+
+# Abbreviations whose period does not end a sentence (titles, saints and places, Bible book and verse references),
+# in the spirit of Moses's nonbreaking prefixes; single-letter initials are handled separately
+_NONBREAKING_PREFIXES = frozenset({
+    "st", "sts", "dr", "mr", "mrs", "ms", "rev", "revd", "fr", "br", "sr", "jr", "mt", "bp", "abp", "hon", "prof",
+    "gen", "ex", "exod", "lev", "num", "deut", "josh", "judg", "sam", "kgs", "chr", "neh", "esth", "ps", "prov",
+    "eccl", "isa", "jer", "lam", "ezek", "dan", "hos", "obad", "mic", "nah", "hab", "zeph", "hag", "zech", "mal",
+    "matt", "mk", "lk", "jn", "rom", "cor", "gal", "eph", "phil", "col", "thess", "tim", "tit", "philem", "heb",
+    "jas", "pet", "jud", "ch", "vv", "vs", "cf",
+})
+
+# Punctuation ignored when matching fixed phrases, including the Arabic comma, semicolon and question mark
+_PHRASE_PUNCTUATION = re.compile(r"[.,!?;:\"'\u060C\u061B\u061F]")
+
+# Curated translations of liturgical phrases and greetings, used instead of the model when a whole input matches
+_FIXED_PHRASES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "resources", "fixed_en_ar.json")
+
+@njit(cache=True)
+def _normalize_arabic_codepoints(codepoints, out):
+    """
+    Drop Arabic diacritics (tashkeel, U+064B..U+0652) and map hamza/madda/wasla alef forms to a bare alef.
+    :param codepoints: 1-D uint32 array of Unicode code points.
+    :param out: Output array at least as long as codepoints.
+    :return: Number of code points written to out.
+    """
+    n = 0
+    for c in codepoints:
+        if 0x064B <= c <= 0x0652:
+            continue
+        if c == 0x0622 or c == 0x0623 or c == 0x0625 or c == 0x0671:
+            c = 0x0627
+        out[n] = c
+        n += 1
+    return n
+
+def _normalize_arabic(text: str) -> str:
+    """
+    Normalize Arabic spelling variants so differently vocalized forms of the same phrase compare equal.
+    :param text: The text to normalize.
+    :return: The text without diacritics and with a single alef form.
+    """
+    codepoints = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+    out = np.empty_like(codepoints)
+    n = _normalize_arabic_codepoints(codepoints, out)
+    return out[:n].tobytes().decode("utf-32-le")
+
+def _split_sentences(text: str) -> list:
+    """
+    Split text into sentences at sentence-final punctuation followed by an uppercase letter or Arabic text,
+    unless the period belongs to a known abbreviation or a single-letter initial ("St. Paul", "1 Cor. 13", "J. Smith").
+    :param text: Stripped source text.
+    :return: The sentences, with their punctuation.
+    """
+    sentences = []
+    start = 0
+    for match in _SENTENCE_BOUNDARY.finditer(text):
+        following = text[match.end()]
+        if not (following.isupper() or "\u0600" <= following <= "\u06FF"):
+            continue
+        if text[match.start() - 1] == ".":
+            word = text[start:match.start()].rsplit(None, 1)[-1].strip("(\"'.").lower()
+            if word in _NONBREAKING_PREFIXES or (len(word) == 1 and word.isalpha()):
+                continue
+        sentences.append(text[start:match.start()])
+        start = match.end()
+    sentences.append(text[start:])
+    return sentences
+
+def _phrase_key(text: str) -> str:
+    """
+    Normalize text for fixed-phrase lookup: lowercase, punctuation removed and whitespace collapsed.
+    :param text: The text to normalize.
+    :return: The lookup key.
+    """
+    return " ".join(_PHRASE_PUNCTUATION.sub("", text).split()).lower()
+
+def _package(translation):
+    """
+    Return the Argos package behind a translation, looking through Argos's caching wrapper.
+    :param translation: An Argos translation object.
+    :return: The Package, or None if the translation is not backed by an installed package.
+    """
+    return getattr(getattr(translation, "underlying", translation), "pkg", None)
+
 class Translator:
     """
     Translator class for English <-> Arabic translation using Argos Translate.
     Initializes the required translation models and provides translation methods.
     """
-    def __init__(self):
-        installed_languages = argostranslate.translate.get_installed_languages()
-        self._english_lang = next((lang for lang in installed_languages if lang.code == "en"), None)
-        self._arabic_lang = next((lang for lang in installed_languages if lang.code == "ar"), None)
+    # Fixed attribute layout: no per-instance __dict__, and attribute reads on the translate path are slot loads
+    __slots__ = (
+        "device", "cpu_threads", "en_tokenizer", "ar_tokenizer",
+        "_compute_type", "_device_index", "_intra_threads", "_inter_threads",
+        "_max_batch_size", "_beam_size", "_split_threshold",
+        "_english_lang", "_arabic_lang",
+        "_en_to_ar_translation", "_ar_to_en_translation", "_en_to_ar_ct2", "_ar_to_en_ct2",
+        "_cache_size", "_cache_en_ar", "_cache_ar_en", "_cache_lock",
+        "_fixed_en_ar", "_fixed_ar_en",
+        "_en_to_ar_loaded", "_ar_to_en_loaded", "_load_lock",
+        "_requests", "_coalesce_wait_sec", "_worker", "_worker_lock",
+    )
+
+    def __init__(self, intra_threads: int = 0, inter_threads: int = 0, device: str = "auto", cache_size: int = 4096, max_batch_size: int = 256, beam_size: int = 1, split_threshold: int = 200, fixed_phrases_path: str = _FIXED_PHRASES_PATH, preload: tuple = ("en->ar",)):
+        """
+        :param intra_threads: CPU threads per batch in each CTranslate2 translator; 0 reads ARGOS_INTRA_THREADS, or
+                              splits half of the cores this process may run on across the inter_threads workers.
+        :param inter_threads: Number of batches each CTranslate2 translator can run in parallel; 0 reads
+                              ARGOS_INTER_THREADS, or uses 1 since the application translates from a single worker.
+        :param device: Device to translate on ("cpu", "cuda", or "auto" to use a CUDA GPU when available).
+        :param cache_size: Number of translated phrases remembered per direction.
+        :param max_batch_size: Maximum number of source tokens CTranslate2 translates in one sub-batch.
+        :param beam_size: Beam width for decoding. 1 (greedy) decodes several times faster than Argos's default of 4;
+                          wider beams can give slightly more fluent translations at a proportional cost in latency.
+        :param split_threshold: Inputs longer than this many characters are split into sentences that are translated
+                                as one batch, since decoding cost grows faster than linearly with input length.
+        :param fixed_phrases_path: JSON file of English -> Arabic phrases that are always translated as given,
+                                   in both directions (skipped if the file does not exist).
+        :param preload: Directions whose models are loaded and warmed up now (default: English to Arabic, the
+                        application's initial mode). Any other direction is loaded by preload() or on first use, so
+                        a one-way session never pays the memory and startup time of the second model.
+        """
+        cuda_devices = ctranslate2.get_cuda_device_count()
+        if device == "auto":
+            device = "cuda" if cuda_devices > 0 else "cpu"
+        self.device = device
+        # On GPU each translator gets a model replica on every visible card so parallel batches spread across them
+        self._device_index = list(range(cuda_devices)) if device == "cuda" and cuda_devices > 1 else 0
+        # Quantized int8 matmuls on CPU and half precision on GPU; ARGOS_COMPUTE_TYPE overrides either
+        self._compute_type = os.environ.get("ARGOS_COMPUTE_TYPE", "float16" if device == "cuda" else "int8")
+        argostranslate.settings.device = device
+        self._max_batch_size = max_batch_size
+        self._beam_size = beam_size
+        self._split_threshold = split_threshold
+        inter_threads = inter_threads or int(os.environ.get("ARGOS_INTER_THREADS", "1"))
+        self._inter_threads = max(1, inter_threads)
+        # Count the cores this process is allowed to use (affinity, cgroup cpusets), not every core on the machine.
+        # Whisper runs at the same time and sizes its pool from the cores left over (see cpu_threads), so together
+        # the two models do not oversubscribe the CPU.
+        available_cores = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else (os.cpu_count() or 2)
+        intra_threads = intra_threads or int(os.environ.get("ARGOS_INTRA_THREADS", "0"))
+        self._intra_threads = intra_threads if intra_threads > 0 else max(1, available_cores // 2 // self._inter_threads)
+        # CPU threads the translation models may keep busy; none when they run on the GPU
+        self.cpu_threads = 0 if device == "cuda" else self._intra_threads * self._inter_threads
+        installed_languages = {lang.code: lang for lang in _get_langs()}
+        self._english_lang = installed_languages.get("en")
+        self._arabic_lang = installed_languages.get("ar")
         if not self._english_lang or not self._arabic_lang:
             argostranslate.package.update_package_index()
             available_packages = argostranslate.package.get_available_packages()
-            for pkg in available_packages:
-                if (pkg.from_code == "en" and pkg.to_code == "ar") or (pkg.from_code == "ar" and pkg.to_code == "en"):
-                    download_path = pkg.download()
-                    argostranslate.package.install_from_path(download_path)
-            installed_languages = argostranslate.translate.get_installed_languages()
-            self._english_lang = next((lang for lang in installed_languages if lang.code == "en"), None)
-            self._arabic_lang = next((lang for lang in installed_languages if lang.code == "ar"), None)
+            packages = [pkg for pkg in available_packages if (pkg.from_code == "en" and pkg.to_code == "ar") or (pkg.from_code == "ar" and pkg.to_code == "en")]
+            # Downloads are network-bound, so they run in parallel; installing is not thread-safe and stays serial
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                download_paths = list(executor.map(lambda pkg: pkg.download(), packages))
+            for download_path in download_paths:
+                argostranslate.package.install_from_path(download_path)
+            _get_langs.cache_clear()
+            installed_languages = {lang.code: lang for lang in _get_langs()}
+            self._english_lang = installed_languages.get("en")
+            self._arabic_lang = installed_languages.get("ar")
         if not self._english_lang or not self._arabic_lang:
             raise RuntimeError("Required translation languages (English and Arabic) are not available.")
         # Get translation objects for English->Arabic and Arabic->English
@@ -30,6 +188,45 @@ class Translator:
         self._ar_to_en_translation = self._arabic_lang.get_translation(self._english_lang)
         if not self._en_to_ar_translation or not self._ar_to_en_translation:
             raise RuntimeError("Failed to load translation models for English<->Arabic.")
+        # Each package's tokenizer encodes its source language and decodes that model's output, so callers can
+        # tokenize once and work with token lists through translate_tokens_*()
+        en_to_ar_pkg = _package(self._en_to_ar_translation)
+        ar_to_en_pkg = _package(self._ar_to_en_translation)
+        self.en_tokenizer = en_to_ar_pkg.tokenizer if en_to_ar_pkg else None
+        self.ar_tokenizer = ar_to_en_pkg.tokenizer if ar_to_en_pkg else None
+        # Argos translations are deterministic, so repeated phrases are served from a per-direction LRU cache
+        self._cache_size = cache_size
+        self._cache_en_ar: "collections.OrderedDict[str, str]" = collections.OrderedDict()
+        self._cache_ar_en: "collections.OrderedDict[str, str]" = collections.OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._fixed_en_ar = {}
+        self._fixed_ar_en = {}
+        if fixed_phrases_path and os.path.exists(fixed_phrases_path):
+            with open(fixed_phrases_path, "r", encoding="utf-8") as f:
+                fixed_phrases = json.load(f)
+            self._fixed_en_ar = {_phrase_key(en): ar for en, ar in fixed_phrases.items()}
+            self._fixed_ar_en = {_phrase_key(_normalize_arabic(ar)): en for en, ar in fixed_phrases.items()}
+        # CTranslate2 models of each direction are created by _load_direction()
+        self._en_to_ar_ct2 = None
+        self._ar_to_en_ct2 = None
+        self._en_to_ar_loaded = False
+        self._ar_to_en_loaded = False
+        self._load_lock = threading.Lock()
+        # Requests from submit_*() wait here for the coalescing worker, which is started on first use.
+        # The bound makes callers block instead of queueing unbounded work when translation falls behind.
+        self._requests = queue.Queue(maxsize=64)
+        self._coalesce_wait_sec = 0.02
+        self._worker = None
+        self._worker_lock = threading.Lock()
+        for direction in preload:
+            self._load_direction(direction)
+
+    def preload(self, direction: str):
+        """
+        Load and warm up one direction's model ahead of its first translation; does nothing if it is already loaded.
+        :param direction: "en->ar" or "ar->en".
+        """
+        self._load_direction(direction)
 
     def translate_en_to_ar(self, text: str) -> str:
         """
@@ -37,7 +234,7 @@ class Translator:
         :param text: The source text in English.
         :return: Translated text in Arabic.
         """
-        return self._en_to_ar_translation.translate(text) if text.strip() != "" else ""
+        return self.translate_en_to_ar_batch([text])[0]
 
     def translate_ar_to_en(self, text: str) -> str:
         """
@@ -45,4 +242,309 @@ class Translator:
         :param text: The source text in Arabic.
         :return: Translated text in English.
         """
-        return self._ar_to_en_translation.translate(text) if text.strip() != "" else ""
+        return self.translate_ar_to_en_batch([text])[0]
+
+    def translate_en_to_ar_batch(self, texts: list) -> list:
+        """
+        Translate several English texts to Arabic with one batched model call.
+        :param texts: The source texts in English.
+        :return: Translated texts in Arabic, in input order (empty strings for empty inputs).
+        """
+        if not self._en_to_ar_loaded:
+            self._load_direction("en->ar")
+        return self._translate_batch(texts, self._fixed_en_ar, self._cache_en_ar, self._en_to_ar_translation, self._en_to_ar_ct2)
+
+    def translate_ar_to_en_batch(self, texts: list) -> list:
+        """
+        Translate several Arabic texts to English with one batched model call.
+        :param texts: The source texts in Arabic.
+        :return: Translated texts in English, in input order (empty strings for empty inputs).
+        """
+        if not self._ar_to_en_loaded:
+            self._load_direction("ar->en")
+        return self._translate_batch(texts, self._fixed_ar_en, self._cache_ar_en, self._ar_to_en_translation, self._ar_to_en_ct2, _normalize_arabic)
+
+    def translate_tokens_en_to_ar(self, tokens: list) -> list:
+        """
+        Translate English text that is already tokenized with en_tokenizer, skipping tokenization and detokenization.
+        :param tokens: English source tokens.
+        :return: Arabic target tokens, which en_tokenizer.decode() turns back into text.
+        """
+        if not self._en_to_ar_loaded:
+            self._load_direction("en->ar")
+        return self._translate_tokens(self._en_to_ar_translation, self._en_to_ar_ct2, [tokens])[0]
+
+    def translate_tokens_ar_to_en(self, tokens: list) -> list:
+        """
+        Translate Arabic text that is already tokenized with ar_tokenizer, skipping tokenization and detokenization.
+        :param tokens: Arabic source tokens.
+        :return: English target tokens, which ar_tokenizer.decode() turns back into text.
+        """
+        if not self._ar_to_en_loaded:
+            self._load_direction("ar->en")
+        return self._translate_tokens(self._ar_to_en_translation, self._ar_to_en_ct2, [tokens])[0]
+
+    def submit_en_to_ar(self, text: str) -> Future:
+        """
+        Queue English text for translation to Arabic without waiting for the result.
+        Requests arriving close together are translated in one batch.
+        :param text: The source text in English.
+        :return: A Future that resolves to the translated text in Arabic.
+        """
+        return self._submit("en->ar", text)
+
+    def submit_ar_to_en(self, text: str) -> Future:
+        """
+        Queue Arabic text for translation to English without waiting for the result.
+        Requests arriving close together are translated in one batch.
+        :param text: The source text in Arabic.
+        :return: A Future that resolves to the translated text in English.
+        """
+        return self._submit("ar->en", text)
+
+    def close(self):
+        """Stop the coalescing worker after the requests already queued have been translated."""
+        with self._worker_lock:
+            worker, self._worker = self._worker, None
+        if worker is not None:
+            self._requests.put(None)
+            worker.join(timeout=5.0)
+
+    def _submit(self, direction: str, text: str) -> Future:
+        """
+        Queue a translation request for the coalescing worker, starting the worker if needed.
+        :param direction: "en->ar" or "ar->en".
+        :param text: The source text.
+        :return: A Future that resolves to the translated text.
+        """
+        with self._worker_lock:
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._coalesce_loop, daemon=True)
+                self._worker.start()
+        future = Future()
+        self._requests.put((direction, text, future))
+        return future
+
+    def _coalesce_loop(self):
+        """Collect requests that arrive within a short window and translate each direction's requests as one batch."""
+        stop = False
+        while not stop:
+            request = self._requests.get()
+            if request is None:
+                break
+            batch = [request]
+            deadline = time.monotonic() + self._coalesce_wait_sec
+            while True:
+                try:
+                    request = self._requests.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if request is None:
+                    stop = True
+                    break
+                batch.append(request)
+            for direction, translate_batch in (("en->ar", self.translate_en_to_ar_batch), ("ar->en", self.translate_ar_to_en_batch)):
+                requests = [(text, future) for d, text, future in batch if d == direction and future.set_running_or_notify_cancel()]
+                if not requests:
+                    continue
+                try:
+                    translated = translate_batch([text for text, _ in requests])
+                except Exception as e:
+                    for _, future in requests:
+                        future.set_exception(e)
+                    continue
+                for (_, future), translated_text in zip(requests, translated):
+                    future.set_result(translated_text)
+
+    def _load_direction(self, direction: str):
+        """
+        Load and warm up one direction's CTranslate2 model, if not done already.
+        :param direction: "en->ar" or "ar->en".
+        """
+        with self._load_lock:
+            if direction == "en->ar":
+                if not self._en_to_ar_loaded:
+                    self._en_to_ar_ct2 = self._load_ct2_translator(self._en_to_ar_translation)
+                    # Translate a short phrase so the weights are mapped in and kernels are selected before real speech
+                    self._run_model(self._en_to_ar_translation, self._en_to_ar_ct2, ["Hello."])
+                    self._en_to_ar_loaded = True
+                return
+            if direction == "ar->en":
+                if not self._ar_to_en_loaded:
+                    self._ar_to_en_ct2 = self._load_ct2_translator(self._ar_to_en_translation)
+                    self._run_model(self._ar_to_en_translation, self._ar_to_en_ct2, ["مرحبا."])
+                    self._ar_to_en_loaded = True
+                return
+        raise ValueError(f"Unknown translation direction: {direction}")
+
+    def _load_ct2_translator(self, translation):
+        """
+        Replace the lazily created CTranslate2 translator of an Argos package translation with one sized for this machine.
+        Argos would otherwise build it with the default thread settings on first use.
+        :param translation: The Argos translation object for one direction.
+        :return: The ctranslate2.Translator, or None if the translation is not backed by an installed package.
+        """
+        pkg = _package(translation)
+        if pkg is None:
+            return None
+        package_translation = getattr(translation, "underlying", translation)
+        model_path = str(pkg.package_path / "model")
+        package_translation.translator = ctranslate2.Translator(
+            model_path,
+            device=self.device,
+            device_index=self._device_index,
+            compute_type=self._compute_type,
+            intra_threads=self._intra_threads,
+            inter_threads=self._inter_threads,
+        )
+        return package_translation.translator
+
+    def _translate_batch(self, texts: list, fixed, cache, translation, ct2_translator, normalize=None) -> list:
+        """
+        Translate texts through a bounded LRU cache keyed on the normalized text; misses are translated together.
+        Inputs that match a curated fixed phrase are answered from the phrase table without the cache or the model.
+        :param texts: The source texts.
+        :param fixed: The direction's fixed-phrase table, keyed by _phrase_key().
+        :param cache: The direction's OrderedDict cache.
+        :param translation: The Argos translation object for the direction.
+        :param ct2_translator: The direction's ctranslate2.Translator, or None to translate through Argos.
+        :param normalize: Optional source-language normalization applied to the lookup keys (not to the model input).
+        :return: Translated texts in input order, with empty strings for inputs shorter than two characters.
+        """
+        results = [""] * len(texts)
+        # Stripped source and indices of each uncached text, so a phrase repeated within the batch is translated once
+        pending = {}
+        with self._cache_lock:
+            for i, text in enumerate(texts):
+                # Empty and whitespace-only inputs (common between utterances) are rejected without allocating
+                if not text or text.isspace():
+                    continue
+                # Surrounding whitespace would only add tokens, so the stripped text is both key and model input
+                stripped = text.strip()
+                if len(stripped) < 2:
+                    continue
+                normalized = normalize(stripped) if normalize is not None else stripped
+                if fixed:
+                    fixed_text = fixed.get(_phrase_key(normalized))
+                    if fixed_text is not None:
+                        results[i] = fixed_text
+                        continue
+                key = normalized.lower()
+                cached = cache.get(key)
+                if cached is not None:
+                    cache.move_to_end(key)
+                    results[i] = cached
+                elif key in pending:
+                    pending[key][1].append(i)
+                else:
+                    pending[key] = (stripped, [i])
+        if not pending:
+            return results
+        sources = [stripped for stripped, _ in pending.values()]
+        translated = self._translate_sentences(translation, ct2_translator, sources)
+        with self._cache_lock:
+            for (key, (_, indices)), translated_text in zip(pending.items(), translated):
+                cache[key] = translated_text
+                for i in indices:
+                    results[i] = translated_text
+            while len(cache) > self._cache_size:
+                cache.popitem(last=False)
+        return results
+
+    def _translate_sentences(self, translation, ct2_translator, sources: list) -> list:
+        """
+        Split long texts into sentences and translate the sentences of all texts in one batch.
+        :param translation: The Argos translation object for the direction.
+        :param ct2_translator: The direction's ctranslate2.Translator, or None to translate through Argos.
+        :param sources: Non-empty, stripped source texts.
+        :return: The translated texts in order, with each text's sentences joined by spaces.
+        """
+        sentences = []
+        counts = []
+        for source in sources:
+            parts = _split_sentences(source) if len(source) > self._split_threshold else [source]
+            sentences.extend(parts)
+            counts.append(len(parts))
+        translated = self._run_model(translation, ct2_translator, sentences)
+        results = []
+        start = 0
+        for count in counts:
+            results.append(" ".join(translated[start:start + count]))
+            start += count
+        return results
+
+    def _run_model(self, translation, ct2_translator, sources: list) -> list:
+        """
+        Translate texts with one CTranslate2 translate_batch call, tokenizing and detokenizing them as Argos does.
+        :param translation: The Argos translation object for the direction.
+        :param ct2_translator: The direction's ctranslate2.Translator, or None to translate through Argos one text at a time.
+        :param sources: Non-empty source texts.
+        :return: The translated texts in order.
+        """
+        if ct2_translator is None:
+            return [translation.translate(source) for source in sources]
+        tokenizer = _package(translation).tokenizer
+        translated = []
+        for tokens in self._translate_tokens(translation, ct2_translator, [tokenizer.encode(source) for source in sources]):
+            value = tokenizer.decode(tokens)
+            # The tokenizer leaves a space in front of the first word
+            if value.startswith(" "):
+                value = value[1:]
+            translated.append(value)
+        return translated
+
+    def _translate_tokens(self, translation, ct2_translator, tokenized: list) -> list:
+        """
+        Translate tokenized sources with one CTranslate2 translate_batch call.
+        :param translation: The Argos translation object for the direction.
+        :param ct2_translator: The direction's ctranslate2.Translator.
+        :param tokenized: Source token lists.
+        :return: The best hypothesis of each source as a token list, without the package's target prefix token.
+        """
+        if ct2_translator is None:
+            raise RuntimeError("Token-level translation needs an installed Argos package for this direction.")
+        target_prefix = _package(translation).target_prefix
+        results = ct2_translator.translate_batch(
+            tokenized,
+            target_prefix=[[target_prefix]] * len(tokenized) if target_prefix else None,
+            replace_unknowns=True,
+            max_batch_size=self._max_batch_size,
+            batch_type="tokens",
+            beam_size=self._beam_size,
+            length_penalty=0.2,
+        )
+        translated = []
+        for result in results:
+            tokens = result.hypotheses[0]
+            if target_prefix and tokens[:1] == [target_prefix]:
+                tokens = tokens[1:]
+            translated.append(tokens)
+        return translated
+
+_instance = None
+_instance_lock = threading.Lock()
+
+def _reset_after_fork():
+    """Drop the inherited Translator in a forked child; its CTranslate2 and worker threads did not survive the fork."""
+    global _instance, _instance_lock
+    _instance = None
+    _instance_lock = threading.Lock()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+def get_translator() -> Translator:
+    """
+    Return the process-wide Translator, creating it on first use so the models are loaded only once.
+    Thread counts follow the Translator defaults, including the ARGOS_INTRA_THREADS and ARGOS_INTER_THREADS overrides.
+    The models are shared by every thread of one process. They cannot be preloaded in a parent and inherited by
+    forked workers (e.g. gunicorn --preload), because CTranslate2's thread pools do not survive fork(); a forked
+    child therefore builds its own instance on first use. To serve concurrent requests from one copy of the
+    weights, run a single process and raise ARGOS_INTER_THREADS instead of adding worker processes.
+    :return: The shared Translator instance.
+    """
+    global _instance
+    with _instance_lock:
+        if _instance is None:
+            _instance = Translator()
+        return _instance